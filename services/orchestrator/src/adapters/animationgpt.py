@@ -10,7 +10,14 @@ from contextlib import contextmanager, redirect_stderr, redirect_stdout
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
-from .base import AdapterResult, BaseAdapter, ProgressReporter, build_asset_ref, build_error
+from .base import (
+    AdapterResult,
+    BaseAdapter,
+    ProgressReporter,
+    build_asset_ref,
+    build_error,
+    job_id_from_uir,
+)
 from ..config.runtime import get_runtime_paths
 from ..uir.validate import validate_uir
 
@@ -40,7 +47,7 @@ class AnimationGPTAdapter(BaseAdapter):
             raise ValueError("missing duration_s")
         if duration < 1 or duration > 60:
             raise ValueError("duration_s must be between 1 and 60")
-        job_id = _job_id_from_uir(uir)
+        job_id = job_id_from_uir(uir)
         _assert_output_dir_writable(job_id, self.modality)
 
     def run(
@@ -49,7 +56,7 @@ class AnimationGPTAdapter(BaseAdapter):
         warnings: List[str] = []
         job_id = ""
         try:
-            job_id = _job_id_from_uir(uir)
+            job_id = job_id_from_uir(uir)
         except ValueError as exc:
             return _error_result(
                 self.provider_id,
@@ -334,15 +341,6 @@ def _error_result(
     }
 
 
-def _job_id_from_uir(uir: Dict[str, Any]) -> str:
-    job = uir.get("job")
-    if isinstance(job, dict):
-        job_id = job.get("id")
-        if job_id:
-            return str(job_id)
-    raise ValueError("missing job.id")
-
-
 def _motion_section(uir: Dict[str, Any]) -> Dict[str, Any]:
     modules = uir.get("modules")
     if isinstance(modules, dict):
@@ -100,6 +100,15 @@ def resolve_output_dir(out_dir: Path, subdir: str) -> Path:
     return output_dir
 
 
+def job_id_from_uir(uir: Dict[str, Any]) -> str:
+    job = uir.get("job")
+    if isinstance(job, dict):
+        job_id = job.get("id")
+        if job_id:
+            return str(job_id)
+    raise ValueError("missing job.id")
+
+
 def build_asset_ref(
     file_path: Union[Path, str],
     job_id: str,
@@ -9,6 +9,7 @@ from .base import (
     BaseAdapter,
     ProgressReporter,
     build_asset_ref,
+    job_id_from_uir,
 )
 from ..uir.validate import validate_uir
 
@@ -30,7 +31,7 @@ class DummyAdapter(BaseAdapter):
     def run(
         self, uir: Dict[str, Any], out_dir: Path, reporter: ProgressReporter
     ) -> AdapterResult:
-        job_id = _job_id_from_uir(uir)
+        job_id = job_id_from_uir(uir)
         output_dir = self.output_dir(out_dir)
         reporter.stage("dummy_start", 0.0, "dummy adapter starting")
         payload = {"provider": self.provider_id, "note": "dummy output"}
@@ -54,12 +55,3 @@ class DummyAdapter(BaseAdapter):
             "warnings": [],
             "error": None,
         }
-
-
-def _job_id_from_uir(uir: Dict[str, Any]) -> str:
-    job = uir.get("job")
-    if isinstance(job, dict):
-        job_id = job.get("id")
-        if job_id:
-            return str(job_id)
-    raise ValueError("missing job.id")
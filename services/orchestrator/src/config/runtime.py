@@ -1,6 +1,8 @@
 import os
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
+from typing import Optional
 
 _REPO_ROOT = Path(__file__).resolve().parents[4]
 _DEFAULT_RUNTIME_DIR = _REPO_ROOT / "runtime"
@@ -20,9 +22,14 @@ def _ensure_dirs(*paths: Path) -> None:
 
 
 def get_runtime_paths() -> RuntimePaths:
-    runtime_dir = Path(
-        os.getenv("ORCH_RUNTIME_DIR", str(_DEFAULT_RUNTIME_DIR))
-    ).expanduser()
+    return _runtime_paths_for(os.getenv("ORCH_RUNTIME_DIR", str(_DEFAULT_RUNTIME_DIR)))
+
+
+# Keyed on the configured directory so tests that swap ORCH_RUNTIME_DIR
+# still get fresh paths, while repeated lookups skip the mkdir calls.
+@lru_cache(maxsize=8)
+def _runtime_paths_for(runtime_dir_value: str) -> RuntimePaths:
+    runtime_dir = Path(runtime_dir_value).expanduser()
     assets_dir = runtime_dir / "assets"
     cache_dir = runtime_dir / "cache"
     logs_dir = runtime_dir / "logs"
@@ -33,3 +40,22 @@ def get_runtime_paths() -> RuntimePaths:
         cache_dir=cache_dir,
         logs_dir=logs_dir,
     )
+
+
+def get_gpu_concurrency() -> int:
+    value = os.getenv("ORCH_GPU_CONCURRENCY", "1")
+    try:
+        return max(1, int(value))
+    except ValueError:
+        return 1
+
+
+def get_gpu_acquire_timeout() -> Optional[float]:
+    value = os.getenv("ORCH_GPU_ACQUIRE_TIMEOUT_S")
+    if not value:
+        return None
+    try:
+        timeout = float(value)
+    except ValueError:
+        return None
+    return timeout if timeout > 0 else None
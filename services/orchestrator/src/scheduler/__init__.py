@@ -2,10 +2,17 @@ from .events import EVENT_BUS, EventBus
 from .models import Job, JobStatus
 from .reporter import ProgressReporter
 from .store import JOB_STORE, JobStore
-from .worker import GPU_SEMAPHORE, JOB_QUEUE, enqueue_job, worker_loop
+from .worker import (
+    GPU_ENCODER_SEMAPHORE,
+    GPU_SEMAPHORE,
+    JOB_QUEUE,
+    enqueue_job,
+    worker_loop,
+)
 
 __all__ = [
     "EVENT_BUS",
+    "GPU_ENCODER_SEMAPHORE",
     "GPU_SEMAPHORE",
     "JOB_QUEUE",
     "JOB_STORE",
@@ -12,7 +12,9 @@ from ..storage.job_fs import ensure_job_dirs, write_uir
 from ..storage.manifest import make_asset_url, write_manifest
 from ..uir import parse_uir, stable_hash
 
-_TERMINAL_STATUSES = {JobStatus.DONE, JobStatus.FAILED, JobStatus.CANCELED}
+_TERMINAL_STATUSES = frozenset(
+    {JobStatus.DONE, JobStatus.FAILED, JobStatus.CANCELED}
+)
 
 
 def _now() -> datetime:
@@ -27,12 +29,12 @@ class JobStore:
 
     def create_job(self, uir: Dict[str, Any]) -> Job:
         uir_model = parse_uir(uir)
-        uir_payload = json.loads(uir_model.json(by_alias=True, exclude_none=True))
         job_id = uuid4().hex
-        job_section = uir_payload.get("job")
-        if isinstance(job_section, dict):
-            job_section["id"] = job_id
-        uir_digest = stable_hash(uir_payload)
+        uir_model.job.id = job_id
+        uir_payload = json.loads(uir_model.json(by_alias=True, exclude_none=True))
+        # Hash the already-validated model; hashing the payload dict would
+        # run parse_uir a second time for the same content.
+        uir_digest = stable_hash(uir_model)
         job = Job(
             job_id=job_id,
             uir=uir_payload,
@@ -1,18 +1,29 @@
 from __future__ import annotations
 
 import asyncio
-from typing import Any, Dict, Iterable, List, Tuple
+from contextlib import asynccontextmanager
+from types import MappingProxyType
+from typing import Any, AsyncIterator, Dict, Iterable, List, Tuple
 
 from .events import EVENT_BUS
-from .models import JobStatus
+from .models import Job, JobStatus
 from .reporter import ProgressReporter
 from .store import JobStore
-from ..config.runtime import get_runtime_paths
+from ..config.runtime import (
+    get_gpu_acquire_timeout,
+    get_gpu_concurrency,
+    get_runtime_paths,
+)
 from ..storage.job_fs import ensure_job_dirs
 from ..storage.manifest import make_asset_url, write_manifest
 
 JOB_QUEUE: asyncio.Queue[str] = asyncio.Queue()
-GPU_SEMAPHORE = asyncio.Semaphore(1)
+# Compute stages share the shader/SM slots; video export runs on the hardware
+# encoder, so it gets its own slots and can overlap with another job's stages.
+# ORCH_GPU_CONCURRENCY sets the slot count, e.g. one per available device.
+GPU_SEMAPHORE = asyncio.Semaphore(get_gpu_concurrency())
+GPU_ENCODER_SEMAPHORE = asyncio.Semaphore(get_gpu_concurrency())
+_GPU_ACQUIRE_TIMEOUT_S = get_gpu_acquire_timeout()
 
 _PIPELINE: Iterable[Tuple[JobStatus, float, Tuple[float, float]]] = (
     (JobStatus.PLANNING, 0.4, (0.0, 0.1)),
@@ -23,13 +34,38 @@ _PIPELINE: Iterable[Tuple[JobStatus, float, Tuple[float, float]]] = (
     (JobStatus.EXPORTING_VIDEO, 0.6, (0.9, 0.99)),
 )
 
-_GPU_STAGES = {
-    JobStatus.RUNNING_MOTION,
-    JobStatus.RUNNING_SCENE,
-    JobStatus.RUNNING_MUSIC,
-    JobStatus.COMPOSING_PREVIEW,
-    JobStatus.EXPORTING_VIDEO,
-}
+_STAGE_ARTIFACTS = MappingProxyType(
+    {
+        JobStatus.RUNNING_SCENE: (
+            ("scene_panorama", "scene/panorama.png", "image/png"),
+        ),
+        JobStatus.RUNNING_MOTION: (
+            ("motion_bvh", "motion/motion.bvh", "text/plain"),
+        ),
+        JobStatus.RUNNING_MUSIC: (
+            ("music_wav", "music/music.wav", "audio/wav"),
+        ),
+        JobStatus.COMPOSING_PREVIEW: (
+            ("preview_config", "preview/preview_config.json", "application/json"),
+        ),
+        JobStatus.EXPORTING_VIDEO: (
+            ("export_mp4", "export/final.mp4", "video/mp4"),
+        ),
+    }
+)
+
+_GPU_STAGES = MappingProxyType(
+    {
+        JobStatus.RUNNING_MOTION: GPU_SEMAPHORE,
+        JobStatus.RUNNING_SCENE: GPU_SEMAPHORE,
+        JobStatus.COMPOSING_PREVIEW: GPU_SEMAPHORE,
+        JobStatus.EXPORTING_VIDEO: GPU_ENCODER_SEMAPHORE,
+    }
+)
+
+_STAGE_MESSAGES = MappingProxyType(
+    {stage: stage.value.lower().replace("_", " ") for stage in JobStatus}
+)
 
 
 async def enqueue_job(job_id: str) -> None:
@@ -64,8 +100,9 @@ async def _run_job(store: JobStore, job_id: str) -> None:
                 progress = job.progress if job else 0.0
                 await reporter.status(JobStatus.CANCELED, progress, "canceled")
                 return
-            if stage in _GPU_STAGES:
-                async with GPU_SEMAPHORE:
+            semaphore = _GPU_STAGES.get(stage)
+            if semaphore is not None:
+                async with _gpu_slot(semaphore):
                     canceled = await _simulate_stage(
                         store, reporter, job_id, stage, duration, progress_range
                     )
@@ -86,6 +123,23 @@ async def _run_job(store: JobStore, job_id: str) -> None:
         await reporter.status(JobStatus.FAILED, progress, f"failed: {exc}")
 
 
+@asynccontextmanager
+async def _gpu_slot(semaphore: asyncio.Semaphore) -> AsyncIterator[None]:
+    if _GPU_ACQUIRE_TIMEOUT_S is None:
+        await semaphore.acquire()
+    else:
+        try:
+            await asyncio.wait_for(semaphore.acquire(), _GPU_ACQUIRE_TIMEOUT_S)
+        except asyncio.TimeoutError as exc:
+            raise RuntimeError(
+                f"timed out after {_GPU_ACQUIRE_TIMEOUT_S:g}s waiting for a GPU slot"
+            ) from exc
+    try:
+        yield
+    finally:
+        semaphore.release()
+
+
 async def _simulate_stage(
     store: JobStore,
     reporter: ProgressReporter,
@@ -95,7 +149,7 @@ async def _simulate_stage(
     progress_range: Tuple[float, float],
 ) -> bool:
     start, end = progress_range
-    message = stage.value.lower().replace("_", " ")
+    message = _STAGE_MESSAGES[stage]
     await reporter.status(stage, start, message)
     steps = 5
     step_sleep = max(duration / steps, 0.0)
@@ -114,6 +168,9 @@ def _is_canceled(store: JobStore, job_id: str) -> bool:
 
 
 def _update_manifest_for_stage(store: JobStore, job_id: str, stage: JobStatus) -> None:
+    new_artifacts = _stage_artifacts(job_id, stage)
+    if not new_artifacts:
+        return
     job = store.get_job(job_id)
     if not job:
         return
@@ -122,72 +179,35 @@ def _update_manifest_for_stage(store: JobStore, job_id: str, stage: JobStatus) -
         stored = job.assets.get("artifacts")
         if isinstance(stored, list):
             artifacts = list(stored)
-    new_artifacts = _stage_artifacts(job_id, stage)
-    if new_artifacts:
-        artifacts.extend(new_artifacts)
-        assets = dict(job.assets) if isinstance(job.assets, dict) else {}
-        assets["artifacts"] = artifacts
-        store.update_job(job_id, assets=assets)
-        job = store.get_job(job_id)
-        if not job:
-            return
-    runtime_paths = get_runtime_paths()
-    job_dir = ensure_job_dirs(runtime_paths.assets_dir, job_id)
+    artifacts.extend(new_artifacts)
+    assets = dict(job.assets) if isinstance(job.assets, dict) else {}
+    assets["artifacts"] = artifacts
+    job = store.update_job(job_id, assets=assets)
+    if not job:
+        return
+    _persist_manifest(store, job, artifacts)
+
+
+def _persist_manifest(
+    store: JobStore, job: Job, artifacts: List[Dict[str, Any]]
+) -> None:
+    job_id = job.job_id
+    job_dir = ensure_job_dirs(get_runtime_paths().assets_dir, job_id)
     write_manifest(job_dir, job.uir, job.status.value, artifacts, [])
-    store.update_job(
-        job_id,
-        manifest_path=str(job_dir / "manifest.json"),
-        manifest_url=make_asset_url(job_id, "manifest.json"),
-    )
+    manifest_path = str(job_dir / "manifest.json")
+    if job.manifest_path != manifest_path:
+        store.update_job(
+            job_id,
+            manifest_path=manifest_path,
+            manifest_url=make_asset_url(job_id, "manifest.json"),
+        )
 
 
 def _stage_artifacts(job_id: str, stage: JobStatus) -> List[Dict[str, Any]]:
-    if stage == JobStatus.RUNNING_SCENE:
-        return [
-            _asset_ref(
-                job_id,
-                "scene_panorama",
-                "scene/panorama.png",
-                "image/png",
-            )
-        ]
-    if stage == JobStatus.RUNNING_MOTION:
-        return [
-            _asset_ref(
-                job_id,
-                "motion_bvh",
-                "motion/motion.bvh",
-                "text/plain",
-            )
-        ]
-    if stage == JobStatus.RUNNING_MUSIC:
-        return [
-            _asset_ref(
-                job_id,
-                "music_wav",
-                "music/music.wav",
-                "audio/wav",
-            )
-        ]
-    if stage == JobStatus.COMPOSING_PREVIEW:
-        return [
-            _asset_ref(
-                job_id,
-                "preview_config",
-                "preview/preview_config.json",
-                "application/json",
-            )
-        ]
-    if stage == JobStatus.EXPORTING_VIDEO:
-        return [
-            _asset_ref(
-                job_id,
-                "export_mp4",
-                "export/final.mp4",
-                "video/mp4",
-            )
-        ]
-    return []
+    return [
+        _asset_ref(job_id, role, rel_path, mime)
+        for role, rel_path, mime in _STAGE_ARTIFACTS.get(stage, ())
+    ]
 
 
 def _asset_ref(job_id: str, role: str, rel_path: str, mime: str) -> Dict[str, Any]:
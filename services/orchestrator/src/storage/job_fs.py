@@ -1,13 +1,25 @@
 from __future__ import annotations
 
+import heapq
 import json
+import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
+
+import orjson
 
 _REQUIRED_SUBDIRS = ("logs", "scene", "motion", "music", "preview", "export")
 
 
 def ensure_job_dirs(base_assets_dir: Path, job_id: str) -> Path:
+    return _ensure_job_dirs_cached(Path(base_assets_dir), job_id)
+
+
+# Every stage of a job asks for the same directories; only the first call
+# per (base, job) needs to touch the filesystem.
+@lru_cache(maxsize=1024)
+def _ensure_job_dirs_cached(base_assets_dir: Path, job_id: str) -> Path:
     base_assets_dir.mkdir(parents=True, exist_ok=True)
     job_dir = base_assets_dir / job_id
     job_dir.mkdir(parents=True, exist_ok=True)
@@ -18,12 +30,25 @@ def ensure_job_dirs(base_assets_dir: Path, job_id: str) -> Path:
 
 def write_uir(job_dir: Path, uir: Dict[str, Any]) -> None:
     job_dir.mkdir(parents=True, exist_ok=True)
-    uir_path = job_dir / "uir.json"
-    with uir_path.open("w", encoding="utf-8") as handle:
-        json.dump(uir, handle, ensure_ascii=True, indent=2, sort_keys=True)
+    write_json_atomic(job_dir / "uir.json", uir)
+
+
+def write_json_atomic(path: Path, payload: Any) -> None:
+    # Write to a sibling temp file and swap it in, so readers never see a
+    # partially written document.
+    tmp_path = path.with_name(path.name + ".tmp")
+    try:
+        data = orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+    except orjson.JSONEncodeError:
+        # orjson rejects integers beyond 64 bits, which free-form UIR
+        # sections can still carry.
+        text = json.dumps(payload, ensure_ascii=True, indent=2, sort_keys=True)
+        data = text.encode("utf-8")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
 
 
-def list_jobs(base_assets_dir: Path) -> List[Dict[str, Any]]:
+def list_jobs(base_assets_dir: Path, limit: Optional[int] = None) -> List[Dict[str, Any]]:
     if not base_assets_dir.exists():
         return []
     manifests: List[Dict[str, Any]] = []
@@ -31,12 +56,13 @@ def list_jobs(base_assets_dir: Path) -> List[Dict[str, Any]]:
         if not entry.is_dir():
             continue
         manifest_path = entry / "manifest.json"
-        if not manifest_path.exists():
-            continue
         try:
-            with manifest_path.open("r", encoding="utf-8") as handle:
-                manifest = json.load(handle)
-        except json.JSONDecodeError:
+            manifest = orjson.loads(manifest_path.read_bytes())
+        except FileNotFoundError:
+            continue
+        except orjson.JSONDecodeError:
+            # Manifests are replaced atomically; this only guards files left
+            # by older writers or edited by hand.
             continue
         if not isinstance(manifest, dict):
             continue
@@ -44,5 +70,11 @@ def list_jobs(base_assets_dir: Path) -> List[Dict[str, Any]]:
             manifest = dict(manifest)
             manifest["job_id"] = entry.name
         manifests.append(manifest)
-    manifests.sort(key=lambda item: item.get("created_at", ""), reverse=True)
+    if limit is not None:
+        return heapq.nlargest(limit, manifests, key=_created_at_key)
+    manifests.sort(key=_created_at_key, reverse=True)
     return manifests
+
+
+def _created_at_key(manifest: Dict[str, Any]) -> Any:
+    return manifest.get("created_at", "")
@@ -1,40 +1,41 @@
 from __future__ import annotations
 
-import copy
 import json
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from types import MappingProxyType
+from typing import Any, Dict, List, Optional, Tuple
 
 from ..config.runtime import get_runtime_paths
-from .job_fs import ensure_job_dirs
-
-_DEFAULT_OUTPUTS: Dict[str, Any] = {
-    "scene": {"panorama": None},
-    "motion": {"bvh": None},
-    "music": {"wav": None},
-    "preview": {"config": None},
-    "export": {"zip": None, "mp4": None},
-}
-
-_ROLE_OUTPUT_MAP = {
-    "scene_panorama": "scene.panorama",
-    "scene_cubemap_faces": "scene.cubemap",
-    "scene_depth": "scene.depth",
-    "scene_meta": "scene.meta",
-    "motion_bvh": "motion.bvh",
-    "motion_meta": "motion.meta",
-    "music_wav": "music.wav",
-    "music_meta": "music.meta",
-    "preview_config": "preview.config",
-    "export_zip": "export.zip",
-    "export_mp4": "export.mp4",
-    "character_manifest": "character.manifest",
-    "character_model_glb": "character.model",
-}
+from ..uir.models import UIR_VERSION
+from .job_fs import ensure_job_dirs, write_json_atomic
+
+_ROLE_OUTPUT_MAP = MappingProxyType(
+    {
+        "scene_panorama": "scene.panorama",
+        "scene_cubemap_faces": "scene.cubemap",
+        "scene_depth": "scene.depth",
+        "scene_meta": "scene.meta",
+        "motion_bvh": "motion.bvh",
+        "motion_meta": "motion.meta",
+        "music_wav": "music.wav",
+        "music_meta": "music.meta",
+        "preview_config": "preview.config",
+        "export_zip": "export.zip",
+        "export_mp4": "export.mp4",
+        "character_manifest": "character.manifest",
+        "character_model_glb": "character.model",
+    }
+)
 
 
 def make_asset_url(job_id: str, *parts: str) -> str:
+    return _make_asset_url_cached(job_id, parts)
+
+
+@lru_cache(maxsize=4096)
+def _make_asset_url_cached(job_id: str, parts: Tuple[str, ...]) -> str:
     safe_parts: List[str] = []
     for part in parts:
         if not part:
@@ -61,7 +62,13 @@ def _manifest_path(job_id: str) -> Path:
 
 
 def _default_outputs() -> Dict[str, Any]:
-    return copy.deepcopy(_DEFAULT_OUTPUTS)
+    return {
+        "scene": {"panorama": None},
+        "motion": {"bvh": None},
+        "music": {"wav": None},
+        "preview": {"config": None},
+        "export": {"zip": None, "mp4": None},
+    }
 
 
 def _manifest_inputs(uir: Any) -> Dict[str, Any]:
@@ -193,7 +200,7 @@ def write_manifest(
         job_section = uir.get("job")
         if isinstance(job_section, dict):
             job_id = str(job_section.get("id", ""))
-    uir_version = "1.0"
+    uir_version = UIR_VERSION
     if isinstance(uir, dict) and uir.get("uir_version"):
         uir_version = str(uir.get("uir_version"))
     manifest = {
@@ -205,9 +212,7 @@ def write_manifest(
         "outputs": outputs,
         "errors": list(errors or []),
     }
-    manifest_path = job_dir / "manifest.json"
-    with manifest_path.open("w", encoding="utf-8") as handle:
-        json.dump(manifest, handle, ensure_ascii=True, indent=2, sort_keys=True)
+    write_json_atomic(job_dir / "manifest.json", manifest)
     return manifest
 
 
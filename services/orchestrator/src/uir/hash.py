@@ -2,41 +2,46 @@ from __future__ import annotations
 
 import hashlib
 import json
-from typing import Any, Dict, Set, Union
+from typing import Any, Dict, Union
+
+try:
+    from pydantic.v1.json import pydantic_encoder
+except ImportError:  # pragma: no cover - pydantic v1 fallback
+    from pydantic.json import pydantic_encoder
 
 from .models import UIR
 from .validate import parse_uir
 
+# json.dumps() builds a new JSONEncoder for every call with non-default
+# options; this one is configured once and reused.
+_CANONICAL_ENCODER = json.JSONEncoder(
+    sort_keys=True,
+    ensure_ascii=True,
+    separators=(",", ":"),
+    default=pydantic_encoder,
+)
+
 
 def stable_hash(uir: Union[UIR, Dict[str, Any]]) -> str:
     model = uir if isinstance(uir, UIR) else parse_uir(uir)
-    canonical = _canonical_dict(model)
-    payload = json.dumps(
-        canonical,
-        sort_keys=True,
-        ensure_ascii=True,
-        separators=(",", ":"),
-    )
-    digest = hashlib.sha256(payload.encode("utf-8")).hexdigest()
-    return f"sha256:{digest}"
+    return _hash_model(model)
 
 
 def uir_hash(uir: Union[UIR, Dict[str, Any]]) -> str:
     return stable_hash(uir)
 
 
+def _hash_model(model: UIR) -> str:
+    payload = _CANONICAL_ENCODER.encode(_canonical_dict(model))
+    digest = hashlib.sha256(payload.encode("ascii"), usedforsecurity=False).hexdigest()
+    return f"sha256:{digest}"
+
+
 def _canonical_dict(model: UIR) -> Dict[str, Any]:
-    data = json.loads(model.json(by_alias=True, exclude_none=True))
-    return _strip_keys(data, {"created_at"})
-
-
-def _strip_keys(value: Any, drop_keys: Set[str]) -> Any:
-    if isinstance(value, dict):
-        return {
-            key: _strip_keys(item, drop_keys)
-            for key, item in value.items()
-            if key not in drop_keys
-        }
-    if isinstance(value, list):
-        return [_strip_keys(item, drop_keys) for item in value]
-    return value
+    # job.created_at is the only timestamp in the schema; excluding it here
+    # keeps the digest stable across resubmissions without a second tree walk.
+    return model.dict(
+        by_alias=True,
+        exclude_none=True,
+        exclude={"job": {"created_at"}},
+    )
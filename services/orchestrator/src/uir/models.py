@@ -26,10 +26,43 @@ except ImportError:  # pragma: no cover - pydantic v1 fallback
         validator,
     )
 
+try:
+    from pydantic.v1.errors import DictError, PydanticTypeError
+except ImportError:  # pragma: no cover - pydantic v1 fallback
+    from pydantic.errors import DictError, PydanticTypeError
+
+
+class DictKeyError(PydanticTypeError):
+    code = "dict.key"
+    msg_template = "object keys must be strings"
+
+
+# Free-form object sections are checked for str keys and shallow-copied;
+# Dict[str, Any] would also run every value through a field validator.
+class OpaqueDict(dict):
+    @classmethod
+    def __get_validators__(cls) -> Any:
+        yield cls.validate
+
+    @classmethod
+    def __modify_schema__(cls, field_schema: Dict[str, Any]) -> None:
+        field_schema.update(type="object")
+
+    @classmethod
+    def validate(cls, value: Any) -> Dict[str, Any]:
+        if not isinstance(value, dict):
+            raise DictError()
+        if not all(isinstance(key, str) for key in value):
+            raise DictKeyError()
+        return dict(value)
+
+
 Targets = conlist(constr(min_length=1), min_items=1, unique_items=True)
 Resolution = conlist(conint(ge=1), min_items=2, max_items=2)
 ExportResolution = conlist(conint(ge=1), min_items=2, max_items=2)
 
+UIR_VERSION = "1.0"
+
 KNOWN_MODULES: Tuple[str, ...] = (
     "scene",
     "motion",
@@ -53,14 +86,14 @@ class AssetRef(UIRBase):
     uri: constr(min_length=1)
     sha256: Optional[constr(min_length=1)] = None
     bytes: Optional[conint(ge=0)] = None
-    meta: Optional[Dict[str, Any]] = None
+    meta: Optional[OpaqueDict] = None
 
 
 class Job(UIRBase):
     id: constr(min_length=1)
     created_at: datetime
     title: Optional[constr(min_length=1)] = None
-    client: Optional[Dict[str, Any]] = None
+    client: Optional[OpaqueDict] = None
     tags: Optional[List[constr(min_length=1)]] = None
     parent_job_id: Optional[constr(min_length=1)] = None
 
@@ -69,7 +102,7 @@ class Input(UIRBase):
     raw_prompt: constr(min_length=1)
     lang: Optional[constr(min_length=2)] = None
     references: Optional[List[AssetRef]] = None
-    ui_choices: Optional[Dict[str, Any]] = None
+    ui_choices: Optional[OpaqueDict] = None
 
 
 class Intent(UIRBase):
@@ -78,7 +111,7 @@ class Intent(UIRBase):
     style: Optional[constr(min_length=1)] = None
     mood: Optional[constr(min_length=1)] = None
     storybeat: Optional[constr(min_length=1)] = None
-    language_policy: Optional[Dict[str, Any]] = None
+    language_policy: Optional[OpaqueDict] = None
 
 
 class RoutingItem(UIRBase):
@@ -103,7 +136,7 @@ class Scene(UIRBase):
     steps: Optional[conint(ge=1)] = None
     cfg_scale: Optional[confloat(ge=0)] = None
     upscale: Optional[bool] = None
-    output: Optional[Dict[str, Any]] = None
+    output: Optional[OpaqueDict] = None
 
     @validator("resolution")
     def _validate_resolution(cls, value: List[int]) -> List[int]:
@@ -118,8 +151,8 @@ class Motion(UIRBase):
     duration_s: Optional[confloat(ge=1)] = None
     fps: conint(ge=15, le=60) = 30
     style: Optional[constr(min_length=1)] = None
-    action_params: Optional[Dict[str, Any]] = None
-    postprocess: Optional[Dict[str, Any]] = None
+    action_params: Optional[OpaqueDict] = None
+    postprocess: Optional[OpaqueDict] = None
 
 
 class Music(UIRBase):
@@ -128,21 +161,21 @@ class Music(UIRBase):
     duration_s: Optional[confloat(ge=1)] = None
     tempo_bpm: Optional[confloat(ge=1)] = None
     genre: Optional[constr(min_length=1)] = None
-    output: Optional[Dict[str, Any]] = None
+    output: Optional[OpaqueDict] = None
 
 
 class Character(UIRBase):
     enabled: bool = False
     character_id: Optional[constr(min_length=1)] = None
     style: Optional[constr(min_length=1)] = None
-    retarget: Optional[Dict[str, Any]] = None
+    retarget: Optional[OpaqueDict] = None
 
 
 class Preview(UIRBase):
     enabled: bool = False
     camera_preset: Optional[constr(min_length=1)] = None
     autoplay: Optional[bool] = None
-    timeline: Optional[Dict[str, Any]] = None
+    timeline: Optional[OpaqueDict] = None
 
 
 class Export(UIRBase):
@@ -174,15 +207,15 @@ class Modules(UIRBase):
 class Constraints(UIRBase):
     max_runtime_s: Optional[confloat(ge=1)] = None
     quality: Optional[constr(min_length=1)] = None
-    safety: Optional[Dict[str, Any]] = None
+    safety: Optional[OpaqueDict] = None
 
 
 class Runtime(UIRBase):
     priority: Optional[conint(ge=0, le=10)] = None
     concurrency_key: Optional[constr(min_length=1)] = None
-    locks: Optional[Dict[str, Any]] = None
-    fallback: Optional[Dict[str, Any]] = None
-    cache_policy: Optional[Dict[str, Any]] = None
+    locks: Optional[OpaqueDict] = None
+    fallback: Optional[OpaqueDict] = None
+    cache_policy: Optional[OpaqueDict] = None
 
 
 class Hooks(UIRBase):
@@ -190,7 +223,7 @@ class Hooks(UIRBase):
 
 
 class UIR(UIRBase):
-    uir_version: Literal["1.0"]
+    uir_version: Literal[UIR_VERSION]
     job: Job
     input_: Input = Field(..., alias="input")
     intent: Intent
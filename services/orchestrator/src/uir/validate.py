@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Dict, List, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple, Union
 
 if TYPE_CHECKING:
     from pydantic import ValidationError
@@ -10,7 +10,7 @@ else:
     except ImportError:  # pragma: no cover - pydantic v1 fallback
         from pydantic import ValidationError
 
-from .models import KNOWN_MODULES, UIR
+from .models import KNOWN_MODULES, UIR, UIR_VERSION
 
 
 class UIRValidationError(ValueError):
@@ -20,15 +20,16 @@ class UIRValidationError(ValueError):
         super().__init__(message)
 
 
-def validate_uir(uir: Dict[str, Any]) -> None:
+def validate_uir(uir: Union[UIR, Dict[str, Any]]) -> None:
     parse_uir(uir)
 
 
-def parse_uir(uir: Dict[str, Any]) -> UIR:
-    try:
-        model = UIR.parse_obj(uir)
-    except ValidationError as exc:
-        raise UIRValidationError(_errors_from_pydantic(exc)) from exc
+def parse_uir(uir: Union[UIR, Dict[str, Any]]) -> UIR:
+    if isinstance(uir, UIR):
+        # Already through pydantic; only the cross-field checks still apply.
+        model = uir
+    else:
+        model = _parse_model(uir)
 
     semantic_errors = _semantic_errors(model)
     if semantic_errors:
@@ -36,13 +37,35 @@ def parse_uir(uir: Dict[str, Any]) -> UIR:
     return model
 
 
+def _parse_model(uir: Dict[str, Any]) -> UIR:
+    # A payload for another schema version is rejected on that field alone,
+    # without walking its modules; a missing version is left to parse_obj.
+    if isinstance(uir, dict) and uir.get("uir_version", UIR_VERSION) != UIR_VERSION:
+        raise UIRValidationError([_version_error()])
+    try:
+        return UIR.parse_obj(uir)
+    except ValidationError as exc:
+        raise UIRValidationError(_errors_from_pydantic(exc)) from exc
+
+
+def _version_error() -> Dict[str, Any]:
+    # Same entry pydantic reports for the Literal on UIR.uir_version.
+    return {
+        "loc": ["uir_version"],
+        "msg": f"unexpected value; permitted: {UIR_VERSION!r}",
+        "type": "value_error.const",
+    }
+
+
 def _semantic_errors(model: UIR) -> List[Dict[str, Any]]:
     errors: List[Dict[str, Any]] = []
     targets = set(model.intent.targets or [])
     modules = model.modules
     for name in KNOWN_MODULES:
+        if name in targets:
+            continue
         module = getattr(modules, name, None)
-        if module and getattr(module, "enabled", False) and name not in targets:
+        if module and getattr(module, "enabled", False):
             errors.append(
                 {
                     "loc": ["modules", name, "enabled"],
@@ -1,9 +1,10 @@
+import json
 import sys
 import unittest
 from pathlib import Path
 from tempfile import TemporaryDirectory
 
-ROOT = Path(__file__).resolve().parents[1]
+ROOT = Path(__file__).parents[1]
 sys.path.insert(0, str(ROOT))
 
 from services.orchestrator.src.storage.job_fs import ensure_job_dirs, list_jobs, write_uir
@@ -36,101 +37,142 @@ def _base_uir(job_id: str) -> dict:
 
 
 class TestJobManifest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls._tmp = TemporaryDirectory()
+        cls._tmp_root = Path(cls._tmp.name)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._tmp.cleanup()
+
+    def _temp_dir(self) -> Path:
+        temp_dir = self._tmp_root / self._testMethodName
+        temp_dir.mkdir()
+        return temp_dir
+
     def test_job_dir_and_manifest_structure(self):
-        with TemporaryDirectory() as temp_dir:
-            base_dir = Path(temp_dir) / "assets"
-            job_id = "job_123"
-            job_dir = ensure_job_dirs(base_dir, job_id)
-            uir = _base_uir(job_id)
-            write_uir(job_dir, uir)
-            artifacts = [
-                {
-                    "id": "scene_1",
-                    "role": "scene_panorama",
-                    "uri": f"/assets/{job_id}/scene/panorama.png",
-                    "mime": "image/png",
-                },
-                {
-                    "id": "motion_1",
-                    "role": "motion_bvh",
-                    "uri": f"/assets/{job_id}/motion/motion.bvh",
-                    "mime": "text/plain",
-                },
-                {
-                    "id": "music_1",
-                    "role": "music_wav",
-                    "uri": f"/assets/{job_id}/music/music.wav",
-                    "mime": "audio/wav",
-                },
-                {
-                    "id": "preview_1",
-                    "role": "preview_config",
-                    "uri": f"/assets/{job_id}/preview/preview_config.json",
-                    "mime": "application/json",
-                },
-                {
-                    "id": "export_1",
-                    "role": "export_mp4",
-                    "uri": f"/assets/{job_id}/export/final.mp4",
-                    "mime": "video/mp4",
-                },
-            ]
-            manifest = write_manifest(job_dir, uir, "DONE", artifacts, [])
-
-            self.assertEqual(
-                set(manifest.keys()),
-                {
-                    "job_id",
-                    "uir_version",
-                    "created_at",
-                    "status",
-                    "inputs",
-                    "outputs",
-                    "errors",
-                },
-            )
-            for name in ("logs", "scene", "motion", "music", "preview", "export"):
-                self.assertTrue((job_dir / name).is_dir())
-            self.assertTrue((job_dir / "uir.json").is_file())
-            self.assertTrue((job_dir / "manifest.json").is_file())
-            self.assertEqual(manifest["job_id"], job_id)
-            self.assertEqual(manifest["status"], "DONE")
-
-            outputs = manifest["outputs"]
-            self.assertEqual(
-                outputs["scene"]["panorama"]["uri"],
-                f"/assets/{job_id}/scene/panorama.png",
-            )
-            self.assertEqual(
-                outputs["motion"]["bvh"]["uri"],
-                f"/assets/{job_id}/motion/motion.bvh",
-            )
-            self.assertEqual(
-                outputs["music"]["wav"]["uri"],
-                f"/assets/{job_id}/music/music.wav",
-            )
-            self.assertEqual(
-                outputs["preview"]["config"]["uri"],
-                f"/assets/{job_id}/preview/preview_config.json",
-            )
-            self.assertEqual(
-                outputs["export"]["mp4"]["uri"],
-                f"/assets/{job_id}/export/final.mp4",
-            )
-            self.assertIsNone(outputs["export"]["zip"])
+        base_dir = self._temp_dir() / "assets"
+        job_id = "job_123"
+        job_dir = ensure_job_dirs(base_dir, job_id)
+        uir = _base_uir(job_id)
+        write_uir(job_dir, uir)
+        artifacts = [
+            {
+                "id": "scene_1",
+                "role": "scene_panorama",
+                "uri": f"/assets/{job_id}/scene/panorama.png",
+                "mime": "image/png",
+            },
+            {
+                "id": "motion_1",
+                "role": "motion_bvh",
+                "uri": f"/assets/{job_id}/motion/motion.bvh",
+                "mime": "text/plain",
+            },
+            {
+                "id": "music_1",
+                "role": "music_wav",
+                "uri": f"/assets/{job_id}/music/music.wav",
+                "mime": "audio/wav",
+            },
+            {
+                "id": "preview_1",
+                "role": "preview_config",
+                "uri": f"/assets/{job_id}/preview/preview_config.json",
+                "mime": "application/json",
+            },
+            {
+                "id": "export_1",
+                "role": "export_mp4",
+                "uri": f"/assets/{job_id}/export/final.mp4",
+                "mime": "video/mp4",
+            },
+        ]
+        manifest = write_manifest(job_dir, uir, "DONE", artifacts, [])
+
+        self.assertEqual(
+            set(manifest.keys()),
+            {
+                "job_id",
+                "uir_version",
+                "created_at",
+                "status",
+                "inputs",
+                "outputs",
+                "errors",
+            },
+        )
+        for name in ("logs", "scene", "motion", "music", "preview", "export"):
+            self.assertTrue((job_dir / name).is_dir())
+        self.assertTrue((job_dir / "uir.json").is_file())
+        self.assertTrue((job_dir / "manifest.json").is_file())
+        self.assertFalse((job_dir / "manifest.json.tmp").exists())
+        self.assertFalse((job_dir / "uir.json.tmp").exists())
+        self.assertEqual(manifest["job_id"], job_id)
+        self.assertEqual(manifest["status"], "DONE")
+
+        outputs = manifest["outputs"]
+        self.assertEqual(
+            outputs["scene"]["panorama"]["uri"],
+            f"/assets/{job_id}/scene/panorama.png",
+        )
+        self.assertEqual(
+            outputs["motion"]["bvh"]["uri"],
+            f"/assets/{job_id}/motion/motion.bvh",
+        )
+        self.assertEqual(
+            outputs["music"]["wav"]["uri"],
+            f"/assets/{job_id}/music/music.wav",
+        )
+        self.assertEqual(
+            outputs["preview"]["config"]["uri"],
+            f"/assets/{job_id}/preview/preview_config.json",
+        )
+        self.assertEqual(
+            outputs["export"]["mp4"]["uri"],
+            f"/assets/{job_id}/export/final.mp4",
+        )
+        self.assertIsNone(outputs["export"]["zip"])
+
+    def test_write_uir_accepts_wide_integers(self):
+        job_dir = self._temp_dir() / "job_wide_int"
+        uir = _base_uir("job_wide_int")
+        uir["runtime"] = {"locks": {"n": 2**70}}
+
+        write_uir(job_dir, uir)
+
+        payload = json.loads((job_dir / "uir.json").read_text(encoding="utf-8"))
+        self.assertEqual(payload["runtime"]["locks"]["n"], 2**70)
+        self.assertFalse((job_dir / "uir.json.tmp").exists())
 
     def test_list_jobs_reads_manifest(self):
-        with TemporaryDirectory() as temp_dir:
-            base_dir = Path(temp_dir) / "assets"
-            job_id = "job_list_1"
+        base_dir = self._temp_dir() / "assets"
+        job_id = "job_list_1"
+        job_dir = ensure_job_dirs(base_dir, job_id)
+        uir = _base_uir(job_id)
+        write_manifest(job_dir, uir, "DONE", [], [])
+
+        manifests = list_jobs(base_dir)
+
+        self.assertEqual(len(manifests), 1)
+        self.assertEqual(manifests[0]["job_id"], job_id)
+
+    def test_list_jobs_limit_returns_newest(self):
+        base_dir = self._temp_dir() / "assets"
+        for idx in range(3):
+            job_id = f"job_limit_{idx}"
             job_dir = ensure_job_dirs(base_dir, job_id)
             uir = _base_uir(job_id)
+            uir["job"]["created_at"] = f"2025-12-2{idx}T00:00:00Z"
             write_manifest(job_dir, uir, "DONE", [], [])
 
-            manifests = list_jobs(base_dir)
+        manifests = list_jobs(base_dir, limit=2)
 
-            self.assertEqual(len(manifests), 1)
-            self.assertEqual(manifests[0]["job_id"], job_id)
+        self.assertEqual(
+            [item["job_id"] for item in manifests],
+            ["job_limit_2", "job_limit_1"],
+        )
 
 
 if __name__ == "__main__":
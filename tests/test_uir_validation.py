@@ -2,10 +2,10 @@ import sys
 import unittest
 from pathlib import Path
 
-ROOT = Path(__file__).resolve().parents[1]
+ROOT = Path(__file__).parents[1]
 sys.path.insert(0, str(ROOT / "services" / "orchestrator" / "src"))
 
-from uir import UIRValidationError, parse_uir, stable_hash, validate_uir
+from uir import UIR, UIRValidationError, parse_uir, stable_hash, validate_uir
 
 
 def _base_uir():
@@ -39,8 +39,15 @@ class TestUIRValidation(unittest.TestCase):
     def test_version_must_match(self):
         payload = _base_uir()
         payload["uir_version"] = "0.9"
-        with self.assertRaises(UIRValidationError):
+        with self.assertRaises(UIRValidationError) as ctx:
             validate_uir(payload)
+        self.assertEqual(ctx.exception.errors[0]["loc"], ["uir_version"])
+        self.assertEqual(ctx.exception.errors[0]["type"], "value_error.const")
+        with self.assertRaises(ValueError) as schema_ctx:
+            UIR.parse_obj(payload)
+        self.assertEqual(
+            ctx.exception.errors[0]["msg"], schema_ctx.exception.errors()[0]["msg"]
+        )
 
     def test_enabled_module_requires_target(self):
         payload = _base_uir()
@@ -48,6 +55,26 @@ class TestUIRValidation(unittest.TestCase):
         with self.assertRaises(UIRValidationError):
             validate_uir(payload)
 
+    def test_parsed_model_still_checks_targets(self):
+        model = parse_uir(_base_uir())
+        model.modules.music.enabled = True
+        with self.assertRaises(UIRValidationError):
+            validate_uir(model)
+
+    def test_free_form_sections_require_str_keys(self):
+        payload = _base_uir()
+        payload["runtime"]["locks"] = {1: "a", "b": 2}
+        with self.assertRaises(UIRValidationError) as ctx:
+            parse_uir(payload)
+        self.assertEqual(ctx.exception.errors[0]["loc"], ["runtime", "locks"])
+
+    def test_free_form_sections_are_copied(self):
+        payload = _base_uir()
+        payload["runtime"]["locks"] = {"gpu": 1}
+        model = parse_uir(payload)
+        model.runtime.locks["x"] = 1
+        self.assertEqual(payload["runtime"]["locks"], {"gpu": 1})
+
     def test_scene_resolution_ratio(self):
         payload = _base_uir()
         payload["modules"]["scene"]["resolution"] = [1000, 1000]
@@ -68,6 +95,20 @@ class TestUIRValidation(unittest.TestCase):
         digest = stable_hash(_base_uir())
         self.assertTrue(digest.startswith("sha256:"))
 
+    def test_stable_hash_ignores_job_created_at(self):
+        payload = _base_uir()
+        payload["job"]["created_at"] = "2026-01-01T00:00:00Z"
+        self.assertEqual(stable_hash(payload), stable_hash(_base_uir()))
+
+    def test_stable_hash_digest_is_pinned(self):
+        # uir_hash is returned to clients; the canonical encoding must not drift.
+        payload = _base_uir()
+        payload["input"]["raw_prompt"] = "\u8df3\u821e\u7684\u673a\u5668\u4eba \u00e9"
+        self.assertEqual(
+            stable_hash(payload),
+            "sha256:3ee94be68ab29b323256b6e0a78a15d1cfd9e1993d2979cef923c2cfb7330bae",
+        )
+
 
 if __name__ == "__main__":
     unittest.main()